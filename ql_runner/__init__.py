@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+青龙面板签到脚本共享运行器
+
+提供各签到脚本共用的部分：通知推送、共享连接池、镜像域名评分选择、
+按优先级和时间预算调度账户、常驻模式、合并报告，以及站点插件接口。
+"""
+from .config import get_setting, parse_duration, set_site_prefixes
+from .engine import (AccountHistory, RunBudget, SiteRun, load_run_budget, make_error_result, process_accounts,
+                     refresh_balances)
+from .mirrors import DomainScorer, probe_domain, select_domain
+from .notification import send_notification
+from .plugin import CheckInJob, Site, mask_phone
+from .profiling import is_profile_mode, is_profiling, phase, start_profiling, stop_profiling
+from .report import format_table, report_results
+from .runner import is_daemon_mode, load_site, main, run_sites, setup_logging
+from .transport import (RateLimiter, create_session, mark_first_request, prefetch_dns, time_to_first_request,
+                        warm_up_connections)
+
+__all__ = [
+    'AccountHistory', 'CheckInJob', 'DomainScorer', 'RateLimiter', 'RunBudget', 'Site', 'SiteRun',
+    'create_session', 'format_table', 'get_setting', 'is_daemon_mode', 'is_profile_mode', 'is_profiling',
+    'load_run_budget', 'load_site', 'main', 'make_error_result', 'mark_first_request', 'mask_phone', 'parse_duration',
+    'phase', 'prefetch_dns', 'probe_domain', 'process_accounts', 'refresh_balances', 'report_results', 'run_sites',
+    'select_domain', 'send_notification', 'set_site_prefixes', 'setup_logging', 'start_profiling', 'stop_profiling',
+    'time_to_first_request', 'warm_up_connections',
+]
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+运行配置读取
+
+运行器级别的配置优先读取 QL_<名称>，其次读取各站点前缀的同名变量（如 SLGJ_DEADLINE），
+这样单站点脚本原有的环境变量在共享运行器下仍然有效。
+"""
+import os
+import logging
+from typing import Iterable, Optional
+
+logger = logging.getLogger('ql_runner')
+
+# 运行器当前使用的站点环境变量前缀
+_site_prefixes: list = []
+
+def set_site_prefixes(prefixes: Iterable[str]):
+    """设置读取配置时回退使用的站点前缀"""
+    _site_prefixes[:] = [p for p in prefixes if p]
+
+def get_setting(name: str, default: str = '', prefix: Optional[str] = None) -> str:
+    """
+    读取配置
+    prefix 指定时只在 QL_ 之前优先读取该站点前缀；否则依次尝试 QL_ 和所有站点前缀
+    """
+    prefixes = [prefix] if prefix else []
+    prefixes.append('QL')
+    if not prefix:
+        prefixes.extend(_site_prefixes)
+    for p in prefixes:
+        value = os.environ.get(f"{p}_{name}", '').strip()
+        if value:
+            return value
+    return default
+
+def get_int_setting(name: str, default: int, prefix: Optional[str] = None) -> int:
+    """读取整数配置，无法解析时使用默认值"""
+    try:
+        return int(get_setting(name, str(default), prefix))
+    except ValueError:
+        return default
+
+def get_float_setting(name: str, default: float, prefix: Optional[str] = None) -> float:
+    """读取浮点数配置，无法解析时使用默认值"""
+    try:
+        return float(get_setting(name, str(default), prefix))
+    except ValueError:
+        return default
+
+def parse_duration(value: str, default: float) -> float:
+    """解析时长配置，支持 300 / 300s / 5m / 1h 形式，返回秒数"""
+    text = (value or '').strip().lower()
+    if not text:
+        return default
+    units = {'s': 1, 'm': 60, 'h': 3600}
+    try:
+        if text[-1] in units:
+            return float(text[:-1]) * units[text[-1]]
+        return float(text)
+    except ValueError:
+        logger.warning(f"无法解析时长配置 '{value}'，使用默认值 {default:.0f} 秒")
+        return default
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""常驻模式：进程内每日定时签到，失败账户在重试窗口内按退避重试"""
+import time
+import logging
+from datetime import datetime
+from typing import Dict, Any, Optional, List
+
+from .config import get_setting, get_int_setting, parse_duration
+from .engine import RunBudget, SiteRun, load_run_budget, make_error_result, process_accounts
+from .profiling import phase, start_profiling, stop_profiling
+from .report import report_results
+from .state import load_json, save_json
+from .transport import reset_first_request, warm_up_in_background
+
+logger = logging.getLogger('ql_runner')
+
+class DaemonState:
+    """
+    常驻模式的当日进度检查点
+    记录每个账户的结果、重试次数和下次重试时间，每次变化后写入磁盘，重启后可继续。
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.date = ''
+        self.accounts: Dict[str, Dict[str, Any]] = {}
+        self.reported = False
+        self.budget_used: Optional[float] = None  # 当日首轮签到使用的时间预算（秒）
+        self.load()
+
+    def load(self):
+        """从磁盘加载检查点"""
+        data = load_json(self.path, '检查点')
+        if isinstance(data, dict):
+            self.date = data.get('date', '')
+            self.accounts = data.get('accounts', {})
+            self.reported = data.get('reported', False)
+            self.budget_used = data.get('budget_used')
+            logger.info(f"已加载检查点: {self.date}，{len(self.accounts)} 个账户")
+
+    def save(self):
+        """写入磁盘"""
+        data = {'date': self.date, 'accounts': self.accounts, 'reported': self.reported,
+                'budget_used': self.budget_used}
+        save_json(self.path, data, '检查点')
+
+    def start_day(self, date: str):
+        """开始新一天的签到"""
+        self.date = date
+        self.accounts = {}
+        self.reported = False
+        self.budget_used = None
+        self.save()
+
+    def record(self, phone: str, result: Dict[str, Any], backoff: float, max_attempts: int):
+        """记录账户结果，失败的账户按指数退避安排下次重试"""
+        entry = self.accounts.setdefault(phone, {'attempts': 0})
+        entry['attempts'] += 1
+        entry['result'] = result
+        if result['status'] in ('失败', '异常', '延后') and entry['attempts'] < max_attempts:
+            entry['next_retry'] = time.time() + backoff * (2 ** (entry['attempts'] - 1))
+        else:
+            entry['next_retry'] = None
+        self.save()
+
+    def due_retries(self, now: float) -> List[str]:
+        """到达重试时间的账户"""
+        return [phone for phone, entry in self.accounts.items()
+                if entry.get('next_retry') and entry['next_retry'] <= now]
+
+    def next_retry_at(self) -> Optional[float]:
+        """最近一次待重试时间"""
+        pending = [entry['next_retry'] for entry in self.accounts.values() if entry.get('next_retry')]
+        return min(pending) if pending else None
+
+def run_daemon(runs: List[SiteRun], profile_dir: Optional[str] = None):
+    """
+    常驻模式：进程内每日定时签到，所有站点共用一个调度
+    - QL_SCHEDULE: 每日开始时间（HH:MM，默认09:00）
+    - QL_RETRY_WINDOW: 开始后允许重试失败账户的时间窗口（默认30m）
+    - QL_RETRY_BACKOFF: 首次重试等待时间，之后每次翻倍（默认60s）
+    - QL_RETRY_MAX: 每个账户每天最多尝试次数（默认5）
+    以上变量也可使用站点前缀（如 SLGJ_SCHEDULE）。
+    域名评分和连接池在进程内保持，每天仅在开始时重新获取一次域名。
+    指定 profile_dir 时，每天从签到开始到发送报告单独进行一次性能分析并写入结果。
+    """
+    schedule = get_setting('SCHEDULE', '09:00')
+    try:
+        hour, minute = (int(x) for x in schedule.split(':', 1))
+    except ValueError:
+        logger.warning(f"无法解析 SCHEDULE='{schedule}'，使用 09:00")
+        hour, minute = 9, 0
+    retry_window = parse_duration(get_setting('RETRY_WINDOW'), 1800)
+    backoff = parse_duration(get_setting('RETRY_BACKOFF'), 60)
+    max_attempts = get_int_setting('RETRY_MAX', 5)
+    warm_count = get_int_setting('WARM_CONNECTIONS', 2)
+    
+    states = {id(run): DaemonState(run.site.state_path('checkpoint.json')) for run in runs}
+    
+    logger.info(f"常驻模式已启动: 每日 {hour:02d}:{minute:02d} 签到，重试窗口 {retry_window:.0f} 秒，"
+                f"首次重试等待 {backoff:.0f} 秒，每日最多尝试 {max_attempts} 次")
+    
+    def _ensure_domain(run: SiteRun) -> str:
+        if not run.domain:
+            run.domain = run.site.discover_domain()
+            logger.info(f"✅ [{run.site.name}] 获取到可用域名: {run.domain}")
+            warm_up_in_background(run.site.probe_url(run.domain), run.site.headers,
+                                  min(warm_count, len(run.accounts)))
+        return run.domain
+    
+    def _window(date: str):
+        """某天签到窗口的开始和结束时间戳"""
+        start = datetime.strptime(date, '%Y-%m-%d').replace(hour=hour, minute=minute).timestamp()
+        return start, start + retry_window
+    
+    def _process(run: SiteRun, accounts: List[Dict[str, str]], budget: Optional[RunBudget] = None):
+        state = states[id(run)]
+        
+        def _on_result(account: Dict[str, str], result: Dict[str, Any]):
+            state.record(account['phone'], result, backoff, max_attempts)
+        
+        budget = budget or load_run_budget(time.perf_counter())
+        process_accounts(run.site, accounts, _ensure_domain(run), _on_result, budget)
+        # 签到后余额在所有账户签到完成后才刷新，结果更新后再保存一次检查点
+        state.save()
+    
+    def _report_ready(run: SiteRun) -> bool:
+        """该站点当日是否可以发送报告：窗口已结束，或所有账户已处理且没有待重试账户"""
+        state = states[id(run)]
+        _, window_end = _window(state.date)
+        all_done = all(acc['phone'] in state.accounts for acc in run.accounts) and state.next_retry_at() is None
+        return time.time() >= window_end or all_done
+    
+    def _report(active: List[SiteRun]):
+        """发送一次合并的当日报告，并在检查点中标记为已报告"""
+        for run in active:
+            state = states[id(run)]
+            run.results = [state.accounts[acc['phone']]['result'] if acc['phone'] in state.accounts
+                           else make_error_result(acc['phone'], '未在窗口内执行', '失败')
+                           for acc in run.accounts]
+        budget = load_run_budget(0.0)
+        used = [states[id(run)].budget_used for run in active if states[id(run)].budget_used is not None]
+        budget.finish(max(used) if used else 0.0)
+        with phase('reporting'):
+            report_results(active, budget)
+        for run in active:
+            states[id(run)].reported = True
+            states[id(run)].save()
+        stop_profiling()
+    
+    def _start_pass(date: str):
+        """本进程内开始处理某天的签到：重新统计首个请求耗时，按需开启当天的性能分析"""
+        nonlocal measured_date
+        if measured_date == date:
+            return
+        measured_date = date
+        reset_first_request()
+        if profile_dir:
+            stop_profiling()
+            start_profiling(profile_dir)
+    
+    measured_date = ''
+    while True:
+        today = datetime.now().strftime('%Y-%m-%d')
+        today_start, today_end = _window(today)
+        
+        # 新的一天：所有站点共用一个时间预算，重新获取域名（评分和连接池保持），处理全部账户
+        starting = [run for run in runs
+                    if states[id(run)].date != today and today_start <= time.time() < today_end]
+        if starting:
+            # 重启前未发送的前一天报告先补发，避免开始新的一天时被检查点覆盖
+            pending = [run for run in starting if states[id(run)].date and not states[id(run)].reported]
+            if pending:
+                logger.info(f"补发 {states[id(pending[0])].date} 未发送的报告")
+                _report(pending)
+            _start_pass(today)
+            day_budget = load_run_budget(time.perf_counter())
+            for run in starting:
+                logger.info(f"[{run.site.name}] 开始 {today} 的签到")
+                states[id(run)].start_day(today)
+                run.domain = ''
+                _process(run, run.accounts, day_budget)
+            day_budget.finish()
+            for run in starting:
+                states[id(run)].budget_used = day_budget.used()
+                states[id(run)].save()
+            continue
+        
+        # 重启前尚未处理的账户和到达重试时间的失败账户（窗口按检查点日期计算，可跨越午夜）
+        worked = False
+        for run in runs:
+            state = states[id(run)]
+            if not state.date or state.reported or time.time() >= _window(state.date)[1]:
+                continue
+            accounts_by_phone = {acc['phone']: acc for acc in run.accounts}
+            due = [acc['phone'] for acc in run.accounts if acc['phone'] not in state.accounts]
+            due += [phone for phone in state.due_retries(time.time()) if phone in accounts_by_phone]
+            if due:
+                # 本进程内当天首次处理（如重启后）时从此刻开始统计
+                _start_pass(state.date)
+                logger.info(f"[{run.site.name}] 处理 {len(due)} 个待签到/待重试账户")
+                _process(run, [accounts_by_phone[phone] for phone in due])
+                worked = True
+        if worked:
+            continue
+        
+        # 所有站点全部完成或重试窗口结束后发送一次合并的当日报告
+        active = [run for run in runs if states[id(run)].date and not states[id(run)].reported]
+        if active and all(_report_ready(run) for run in active):
+            _report(active)
+            active = []
+        
+        # 休眠至下一个事件（重试、窗口结束或次日开始），每分钟至少醒来一次
+        next_events = [today_start if today_start > time.time() else today_start + 86400]
+        for run in active:
+            window_end = _window(states[id(run)].date)[1]
+            next_retry = states[id(run)].next_retry_at()
+            next_events.append(min(next_retry, window_end) if next_retry else window_end)
+        sleep_seconds = max(1.0, min(min(next_events) - time.time(), 60.0))
+        time.sleep(sleep_seconds)
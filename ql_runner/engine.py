@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""账户调度：按优先级处理账户，遵守运行时间预算"""
+import time
+import random
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple
+
+from .config import get_float_setting, get_int_setting, get_setting, parse_duration
+from .plugin import CheckInJob, Site, mask_phone
+from .profiling import is_profiling, phase
+from .state import load_json, save_json
+from .transport import PROCESS_START, RateLimiter
+
+logger = logging.getLogger('ql_runner')
+
+class SiteRun:
+    """一个站点在本次运行中的账户、所用域名和结果"""
+
+    def __init__(self, site: Site, accounts: List[Dict[str, str]]):
+        self.site = site
+        self.accounts = accounts
+        self.domain = ''
+        self.results: List[Dict[str, Any]] = []
+
+class AccountHistory:
+    """
+    账户签到历史（跨运行持久化）
+    记录每个账户最近一次结果和最近成功日期，以及单个账户完整流程（登录→余额→签到）耗时的EWMA，
+    用于安排账户处理顺序和估算时间预算。
+    """
+
+    def __init__(self, path: str, alpha: float = 0.3, default_cycle: float = 10.0):
+        self.path = path
+        self.alpha = alpha
+        self.cycle_seconds = default_cycle
+        self.accounts: Dict[str, Dict[str, Any]] = {}
+        self.load()
+
+    def load(self):
+        """从磁盘加载历史"""
+        data = load_json(self.path, '账户历史')
+        if isinstance(data, dict):
+            self.cycle_seconds = float(data.get('cycle_seconds', self.cycle_seconds))
+            self.accounts = data.get('accounts', {})
+
+    def save(self):
+        """写入磁盘"""
+        save_json(self.path, {'cycle_seconds': self.cycle_seconds, 'accounts': self.accounts}, '账户历史')
+
+    def priority(self, phone: str) -> Tuple[int, int]:
+        """排序键：今日未成功签到的优先，其中上次失败的最优先"""
+        entry = self.accounts.get(phone, {})
+        today = datetime.now().strftime('%Y-%m-%d')
+        signed_today = entry.get('last_success_date') == today
+        failed_last = entry.get('last_status') in ('失败', '异常', '延后')
+        return (1 if signed_today else 0, 0 if failed_last else 1)
+
+    def record(self, phone: str, result: Dict[str, Any], cycle_time: Optional[float] = None):
+        """记录账户结果；cycle_time 为单个账户流程耗时（无论成败），用于更新耗时估计"""
+        entry = self.accounts.setdefault(phone, {})
+        entry['last_status'] = result['status']
+        if result['status'] == '成功':
+            entry['last_success_date'] = datetime.now().strftime('%Y-%m-%d')
+        if cycle_time is not None:
+            self.cycle_seconds += self.alpha * (cycle_time - self.cycle_seconds)
+
+class RunBudget:
+    """运行时间预算，total 为 None 表示不限时"""
+
+    def __init__(self, total: Optional[float], start: Optional[float] = None):
+        self.total = total
+        self.start = time.perf_counter() if start is None else start
+        self.used_seconds: Optional[float] = None
+
+    def finish(self, used: Optional[float] = None):
+        """结束计时，之后 used() 不再增长；used 指定时直接使用给定的已用秒数（如从检查点恢复）"""
+        self.used_seconds = self.used() if used is None else used
+
+    def used(self) -> float:
+        if self.used_seconds is not None:
+            return self.used_seconds
+        return time.perf_counter() - self.start
+
+    def remaining(self) -> float:
+        if self.total is None:
+            return float('inf')
+        return self.total - self.used()
+
+    def can_afford(self, cost: float) -> bool:
+        """剩余预算能否覆盖一次预计耗时为 cost 秒的操作"""
+        return self.remaining() >= cost
+
+    def describe(self) -> str:
+        if self.total is None:
+            return f"未设置（已用 {self.used():.1f}秒）"
+        return f"已用 {self.used():.1f}秒 / {self.total:.0f}秒 ({self.used() / self.total * 100:.0f}%)"
+
+def load_run_budget(start: Optional[float] = PROCESS_START) -> RunBudget:
+    """从 QL_DEADLINE（或站点前缀的 DEADLINE，如 SLGJ_DEADLINE）读取本次运行的时间预算"""
+    deadline = get_setting('DEADLINE')
+    total = parse_duration(deadline, 0) if deadline else 0
+    return RunBudget(total if total > 0 else None, start)
+
+def make_error_result(phone: str, message: str, status: str = '异常') -> Dict[str, Any]:
+    """构造未能正常执行签到流程的账户结果"""
+    return {
+        'phone': phone,
+        'nickname': '未知',
+        'status': status,
+        'message': message,
+        'balance': 0,
+        'increase': 0,
+        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+def estimate_refresh_seconds(count: int, timeout: float) -> float:
+    """估计刷新 count 个账户签到后余额所需的时间：按 QL_REFRESH_RATE 限速排队的时间加一次请求超时"""
+    if count <= 0:
+        return 0.0
+    rate = get_float_setting('REFRESH_RATE', 2.0)
+    return (count / rate if rate > 0 else 0.0) + timeout
+
+def refresh_balances(jobs: List[CheckInJob], budget: Optional[RunBudget] = None):
+    """
+    所有账户签到完成后，并发且限速地刷新签到后余额并计算增加金额
+    - QL_REFRESH_CONCURRENCY: 并发数（默认3）
+    - QL_REFRESH_RATE: 每秒最多发起的请求数（默认2）
+    设置了时间预算时只刷新剩余预算能覆盖的账户，其余账户保留签到前余额。
+    性能分析时在当前线程中串行刷新，使 cProfile 和 CPU 时间能覆盖这一阶段。
+    """
+    if not jobs:
+        return
+    if budget and not budget.can_afford(estimate_refresh_seconds(len(jobs), jobs[0].request_timeout)):
+        rate = get_float_setting('REFRESH_RATE', 2.0)
+        affordable = max(0, int((budget.remaining() - jobs[0].request_timeout) * rate))
+        logger.warning(f"剩余时间预算 {budget.remaining():.1f}秒 只够刷新 {min(affordable, len(jobs))}/{len(jobs)} 个账户的"
+                       f"签到后余额，其余账户保留签到前余额")
+        jobs = jobs[:affordable]
+        if not jobs:
+            return
+    
+    limiter = RateLimiter(get_float_setting('REFRESH_RATE', 2.0))
+    concurrency = 1 if is_profiling() else max(1, min(get_int_setting('REFRESH_CONCURRENCY', 3), len(jobs)))
+    logger.info(f"刷新 {len(jobs)} 个账户的签到后余额（并发 {concurrency}）")
+    
+    def _refresh(job: CheckInJob):
+        limiter.wait()
+        result = job.check_in_result
+        old_balance = result['balance']
+        try:
+            new_balance = job.refresh_balance()
+        except Exception as e:
+            logger.warning(f"刷新余额失败 {mask_phone(job.username)}: {e}")
+            return
+        if new_balance is None:
+            logger.warning(f"刷新余额失败 {mask_phone(job.username)}，保留签到前余额")
+            return
+        if new_balance > old_balance:
+            result['increase'] = new_balance - old_balance
+            logger.info(f"💰 {mask_phone(job.username)} 余额增加: ¥{result['increase']:.2f}，当前余额: ¥{new_balance:.2f}")
+        result['balance'] = new_balance
+        job.needs_balance_refresh = False
+    
+    with phase('post_check_in_wallet'):
+        if concurrency == 1:
+            for job in jobs:
+                _refresh(job)
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='refresh') as pool:
+                list(pool.map(_refresh, jobs))
+
+def process_accounts(site: Site, accounts: List[Dict[str, str]], available_domain: str, on_result=None,
+                     budget: Optional[RunBudget] = None) -> List[Dict[str, Any]]:
+    """
+    按优先级为每个账户执行签到，返回结果列表（保持账户原有顺序）
+    on_result: 每个账户完成后的回调 (account, result)，用于保存进度
+    budget: 时间预算，剩余时间不足以完成一个账户的完整流程时，其余账户标记为延后（首个账户总是处理）
+    签到后余额不在每个账户的流程中读取，而是在所有账户签到完成后统一刷新。
+    """
+    history = AccountHistory(site.state_path('accounts.json'))
+    order = sorted(range(len(accounts)), key=lambda i: history.priority(accounts[i]['phone']))
+    results: Dict[int, Dict[str, Any]] = {}
+    refresh_jobs: List[CheckInJob] = []
+    
+    for step, i in enumerate(order, 1):
+        account = accounts[i]
+        
+        # 账户间延迟，避免请求过快
+        if step > 1:
+            delay = random.randint(3, 8)
+            # 为签到后的余额刷新预留时间（包括本账户可能新增的一次刷新）
+            reserve = estimate_refresh_seconds(len(refresh_jobs) + 1, site.job_class.request_timeout)
+            if budget and not budget.can_afford(delay + history.cycle_seconds + reserve):
+                logger.warning(f"剩余时间预算 {budget.remaining():.1f}秒 不足以再处理一个账户"
+                               f"（预计 {delay + history.cycle_seconds:.1f}秒，另需为余额刷新预留 {reserve:.1f}秒），"
+                               f"其余账户延后")
+                break
+            logger.info(f"等待 {delay} 秒后处理下一个账户...")
+            with phase('delay'):
+                time.sleep(delay)
+        elif budget and budget.remaining() <= 0:
+            logger.warning("时间预算已用尽，全部账户延后")
+            break
+        elif budget and not budget.can_afford(history.cycle_seconds):
+            # 耗时估计只在账户实际运行后更新，首个账户总是处理，避免估计偏高时每次运行都全部延后
+            logger.warning(f"剩余时间预算 {budget.remaining():.1f}秒 少于预计耗时 {history.cycle_seconds:.1f}秒，"
+                           f"仍处理首个账户以更新耗时估计")
+        
+        logger.info("\n" + "🔄" * 35)
+        logger.info(f"[{site.name}] 处理账户 {step}/{len(accounts)}: {mask_phone(account['phone'])}")
+        logger.info("🔄" * 35)
+        
+        start_time = time.perf_counter()
+        cycle_time = None
+        try:
+            # 使用获取到的域名初始化账户签到任务
+            job = site.create_job(account, available_domain)
+            result = job.run()
+            # 失败的流程（如登录超时）同样占用预算，也计入耗时估计，避免低估
+            cycle_time = time.perf_counter() - start_time
+            if result['status'] == '成功' and job.needs_balance_refresh:
+                refresh_jobs.append(job)
+        except Exception as e:
+            logger.error(f"处理第 {i + 1} 个账户失败: {str(e)}", exc_info=True)
+            result = make_error_result(account['phone'], str(e)[:50])
+        results[i] = result
+        history.record(account['phone'], result, cycle_time)
+        history.save()
+        if on_result:
+            on_result(account, result)
+    
+    # 签到全部完成后统一刷新余额
+    refresh_balances(refresh_jobs, budget)
+    
+    # 预算用尽未处理的账户标记为延后，而非失败
+    for i, account in enumerate(accounts):
+        if i not in results:
+            result = make_error_result(account['phone'], '时间预算不足，延后执行', '延后')
+            results[i] = result
+            history.record(account['phone'], result)
+            if on_result:
+                on_result(account, result)
+    history.save()
+    
+    return [results[i] for i in range(len(accounts))]
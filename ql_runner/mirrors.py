@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""镜像域名评分与选择"""
+import time
+import random
+import logging
+import threading
+import requests
+from typing import Dict, Optional, List
+
+from .state import load_json, save_json
+
+logger = logging.getLogger('ql_runner')
+
+class DomainScorer:
+    """
+    域名评分器
+    为每个域名维护延迟和错误率的指数加权移动平均（EWMA），跨运行持久化。
+    分数越低越好：分数 = 平均延迟 + 错误率 * 错误惩罚秒数。
+    """
+
+    def __init__(self, path: str, alpha: float = 0.3, explore_rate: float = 0.1, error_penalty: float = 5.0):
+        self.path = path
+        self.alpha = alpha
+        self.explore_rate = explore_rate
+        self.error_penalty = error_penalty
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    @staticmethod
+    def _key(domain: str) -> str:
+        return domain.strip().rstrip('/')
+
+    def load(self):
+        """从磁盘加载评分"""
+        data = load_json(self.path, '域名评分')
+        if isinstance(data, dict):
+            self.stats = {k: v for k, v in data.items() if isinstance(v, dict)}
+            logger.debug(f"已加载 {len(self.stats)} 个域名评分: {self.path}")
+
+    def save(self):
+        """写入磁盘"""
+        with self._lock:
+            data = {k: dict(v) for k, v in self.stats.items()}
+        save_json(self.path, data, '域名评分')
+
+    def record(self, domain: str, latency: Optional[float], ok: bool):
+        """记录一次请求结果，latency 为 None 表示请求未完成"""
+        key = self._key(domain)
+        with self._lock:
+            stat = self.stats.get(key)
+            if stat is None:
+                stat = {
+                    'latency': latency if latency is not None else self.error_penalty,
+                    'error_rate': 0.0 if ok else 1.0,
+                    'samples': 0
+                }
+                self.stats[key] = stat
+            else:
+                if latency is not None:
+                    stat['latency'] += self.alpha * (latency - stat['latency'])
+                stat['error_rate'] += self.alpha * ((0.0 if ok else 1.0) - stat['error_rate'])
+            stat['samples'] = int(stat.get('samples', 0)) + 1
+            stat['updated'] = int(time.time())
+
+    def record_outcome(self, domain: str, ok: bool):
+        """
+        记录一次业务请求（如登录）的成败，只更新错误率
+        业务请求耗时包含后端处理时间，与探测延迟不可比，不计入延迟平均值；未探测过的域名不记录。
+        """
+        key = self._key(domain)
+        with self._lock:
+            stat = self.stats.get(key)
+            if stat is None:
+                return
+            stat['error_rate'] += self.alpha * ((0.0 if ok else 1.0) - stat['error_rate'])
+            stat['updated'] = int(time.time())
+
+    def score(self, domain: str) -> float:
+        """域名分数，未测量过的域名记为0，以便优先探测"""
+        stat = self.stats.get(self._key(domain))
+        if not stat:
+            return 0.0
+        return stat['latency'] + stat['error_rate'] * self.error_penalty
+
+    def rank(self, domains: List[str]) -> List[str]:
+        """按分数排序，并以一定概率将一个非最优域名提前探测，保证其他域名的评分持续更新"""
+        ranked = sorted(domains, key=self.score)
+        if len(ranked) > 1 and random.random() < self.explore_rate:
+            explore = ranked.pop(random.randrange(1, len(ranked)))
+            ranked.insert(0, explore)
+            logger.info(f"本次探索域名: {explore}")
+        return ranked
+
+    def describe(self, domain: str) -> str:
+        """评分的可读描述"""
+        stat = self.stats.get(self._key(domain))
+        if not stat:
+            return "暂无评分"
+        return (f"{self.score(domain):.3f} (平均延迟 {stat['latency'] * 1000:.0f}ms, "
+                f"错误率 {stat['error_rate'] * 100:.0f}%, 样本 {stat.get('samples', 0)})")
+
+def probe_domain(session: requests.Session, headers: Dict[str, str], domain: str,
+                 probe_path: str, scorer: DomainScorer) -> bool:
+    """探测域名是否可用，并将延迟和结果计入评分"""
+    start_time = time.time()
+    try:
+        test_url = domain.rstrip('/') + probe_path
+        resp = session.options(
+            test_url,
+            headers=headers,
+            timeout=5,
+            verify=False
+        )
+        # 只要不是服务器错误即可认为可用
+        alive = resp.status_code < 500
+        scorer.record(domain, time.time() - start_time, alive)
+        return alive
+    except Exception:
+        scorer.record(domain, None, False)
+        return False
+
+def select_domain(session: requests.Session, headers: Dict[str, str], domain_list: List[str],
+                  backup_domains: List[str], probe_path: str, scorer: DomainScorer) -> str:
+    """按评分从域名列表（及备用域名）中选择可用域名"""
+    try:
+        # 按评分依次探测，选择第一个可用的域名
+        for dom in scorer.rank(domain_list):
+            if probe_domain(session, headers, dom, probe_path, scorer):
+                logger.info(f"选择可用域名: {dom} (评分: {scorer.describe(dom)})")
+                return dom
+            else:
+                logger.warning(f"域名不可用，跳过: {dom}")
+
+        # 如果所有获取的域名不可用，则使用备用域名并验证
+        logger.info(f"尝试备用域名列表: {backup_domains}")
+        for dom in scorer.rank(backup_domains):
+            if probe_domain(session, headers, dom, probe_path, scorer):
+                logger.info(f"备用域名可用: {dom} (评分: {scorer.describe(dom)})")
+                return dom
+            else:
+                logger.warning(f"备用域名不可用: {dom}")
+
+        # 最后一手段，返回第一个原始域名或备选
+        fallback = domain_list[0] if domain_list else (backup_domains[0] if backup_domains else '')
+        logger.warning(f"未找到可用域名，使用回退: {fallback}")
+        return fallback
+    finally:
+        scorer.save()
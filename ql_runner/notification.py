@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""通知推送（青龙面板环境）"""
+import os
+import logging
+
+logger = logging.getLogger('ql_runner')
+
+def send_notification(title: str, content: str):
+    """发送通知"""
+    try:
+        # 尝试导入青龙面板的通知模块
+        try:
+            from notify import send as ql_send
+            ql_send(f"{title}", content)
+            logger.info(f"已通过青龙通知发送: {title}")
+            return
+        except ImportError:
+            pass
+        
+        # 检查青龙面板环境变量
+        env_vars = {
+            'PUSH_PLUS_TOKEN': 'pushplus',
+            'BARK_PUSH': 'bark',
+            'TG_BOT_TOKEN': 'telegram',
+            'DD_BOT_TOKEN': '钉钉',
+            'FSKEY': '飞书'
+        }
+        
+        # 输出到日志，青龙面板会捕获
+        logger.info(f"【{title}】{content}")
+        
+        # 如果青龙面板有通知配置，这里可以添加推送逻辑
+        for env_var, platform in env_vars.items():
+            if os.environ.get(env_var):
+                logger.info(f"检测到{platform}通知配置，可在此处实现推送")
+                
+    except Exception as e:
+        logger.error(f"发送通知失败: {e}")
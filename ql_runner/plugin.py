@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+站点插件接口
+
+新增签到脚本时继承 Site 描述站点（账户来源、域名发现、探测路径），
+继承 CheckInJob 实现单个账户的 login / get_balance / sign_in 三个步骤。
+"""
+import os
+import logging
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Type
+
+from .config import get_setting, get_float_setting
+from .mirrors import DomainScorer, select_domain
+from .profiling import phase
+from .transport import create_session, prefetch_dns, mark_first_request
+
+logger = logging.getLogger('ql_runner')
+
+def mask_phone(phone: str) -> str:
+    """隐藏手机号中间四位"""
+    return f"{phone[:3]}****{phone[-4:]}"
+
+class CheckInJob:
+    """
+    单个账户的签到任务基类
+    子类实现 login / get_balance / sign_in，run() 依次执行并把结果写入 check_in_result。
+    """
+
+    # 单次请求超时（秒），运行器据此估计签到后余额刷新所需的时间预算
+    request_timeout: float = 15
+
+    def __init__(self, phone: str, password: str, base_url: str = "", site: Optional['Site'] = None):
+        # 直接使用传入的认证信息
+        self.username = phone.strip()
+        self.password = password.strip()
+        
+        if not self.username or not self.password:
+            error_msg = "错误: 账户信息不完整"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        self.site = site
+        
+        # 初始化session（共享连接池）
+        self.session = create_session()
+        
+        # 默认请求头
+        self.base_headers = dict(site.headers) if site else {}
+        
+        self.base_url = base_url  # 使用传入的域名
+        self.needs_balance_refresh = False  # 签到成功但尚未得到签到后余额，由运行器统一刷新
+        self.check_in_result = {  # 签到结果
+            'phone': self.username,
+            'nickname': '未知',
+            'status': '未开始',
+            'message': '',
+            'balance': 0,
+            'increase': 0,
+            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+
+    def login(self) -> bool:
+        """登录，成功时应设置 check_in_result['nickname']"""
+        raise NotImplementedError
+
+    def get_balance(self) -> Optional[float]:
+        """获取当前余额，失败返回 None"""
+        raise NotImplementedError
+
+    def sign_in(self) -> bool:
+        """
+        签到，需设置 check_in_result 中的 status / message
+        签到成功时将 needs_balance_refresh 设为 True，签到后余额和增加金额由运行器统一刷新
+        """
+        raise NotImplementedError
+
+    def refresh_balance(self) -> Optional[float]:
+        """签到后刷新余额（复用已登录的token），默认调用 get_balance"""
+        return self.get_balance()
+
+    def run(self) -> Dict[str, Any]:
+        """执行签到流程，返回结果"""
+        print("=" * 70)
+        logger.info(f"开始处理账号: {mask_phone(self.username)}")
+        logger.info(f"当前时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print("=" * 70)
+        
+        # 步骤1: 登录
+        logger.info("\n" + "📱" * 10 + " 开始登录 " + "📱" * 10)
+        mark_first_request()
+        with phase('login'):
+            logged_in = self.login()
+        if not logged_in:
+            self.check_in_result['status'] = '失败'
+            if not self.check_in_result['message']:
+                self.check_in_result['message'] = '登录失败'
+            return self.check_in_result
+        
+        # 步骤2: 获取签到前的余额
+        logger.info("\n" + "💰" * 10 + " 获取签到前余额 " + "💰" * 10)
+        with phase('wallet'):
+            balance = self.get_balance()
+        if balance is not None:
+            self.check_in_result['balance'] = balance
+        
+        # 步骤3: 签到
+        logger.info("\n" + "✅" * 10 + " 开始签到 " + "✅" * 10)
+        with phase('check_in'):
+            success = self.sign_in()
+        
+        print("\n" + "=" * 70)
+        if success:
+            logger.info("🎉 签到流程完成 - 成功 🎉")
+        else:
+            logger.info("❌ 签到流程完成 - 失败 ❌")
+        print("=" * 70)
+        
+        # 输出总结信息
+        logger.info(f"\n📊 执行总结:")
+        logger.info(f"  账号: {mask_phone(self.username)}")
+        logger.info(f"  昵称: {self.check_in_result['nickname']}")
+        logger.info(f"  使用域名: {self.base_url}")
+        if self.site:
+            logger.info(f"  域名评分: {self.site.scorer.describe(self.base_url)}")
+        if self.needs_balance_refresh:
+            logger.info(f"  签到前余额: ¥{self.check_in_result['balance']:.2f}（签到后余额稍后统一刷新）")
+        else:
+            logger.info(f"  当前余额: ¥{self.check_in_result['balance']:.2f}")
+        logger.info(f"  执行时间: {self.check_in_result['timestamp']}")
+        logger.info(f"  签到结果: {self.check_in_result['status']}")
+        if self.check_in_result['message']:
+            logger.info(f"  详情: {self.check_in_result['message']}")
+        
+        return self.check_in_result
+
+class Site:
+    """
+    站点插件基类
+    子类设置类属性并实现 load_accounts()，需要从远程获取域名列表时实现 fetch_domain_list()。
+    """
+    name = ''                           # 站点名称，显示在报告中
+    key = ''                            # 状态文件前缀，大写后作为环境变量前缀（如 slgj -> SLGJ_DEADLINE）
+    probe_path = '/'                    # 探测域名可用性的请求路径
+    backup_domains: List[str] = []      # 远程域名列表不可用时的备用域名
+    headers: Dict[str, str] = {}        # 默认请求头
+    job_class: Type[CheckInJob] = CheckInJob
+
+    def __init__(self, script_path: Optional[str] = None):
+        self.env_prefix = self.key.upper()
+        default_dir = os.path.dirname(os.path.abspath(script_path)) if script_path else os.getcwd()
+        self.state_dir = get_setting('STATE_DIR', '', self.env_prefix) or default_dir
+        self.scorer = DomainScorer(
+            self.state_path('domain_scores.json'),
+            explore_rate=get_float_setting('EXPLORE_RATE', 0.1, self.env_prefix)
+        )
+
+    def state_path(self, name: str) -> str:
+        """站点状态文件路径"""
+        return os.path.join(self.state_dir, f"{self.key}_{name}")
+
+    def accounts_configured(self) -> bool:
+        """是否配置了账户（只检查配置是否存在，不解析），未配置时运行器不会为该站点获取域名"""
+        return True
+
+    def load_accounts(self) -> List[Dict[str, str]]:
+        """读取账户列表（每个账户至少包含 phone 和 password），未配置时返回空列表"""
+        raise NotImplementedError
+
+    def fetch_domain_list(self, session: requests.Session) -> List[str]:
+        """获取远程域名列表，默认没有远程列表，只使用备用域名"""
+        return []
+
+    def probe_url(self, domain: str) -> str:
+        """探测及预热连接使用的地址"""
+        return domain.rstrip('/') + self.probe_path
+
+    def discover_domain(self) -> str:
+        """获取域名列表并按评分选择可用域名"""
+        with phase('discovery'):
+            logger.info(f"[{self.name}] 开始获取可用域名...")
+            
+            # 创建临时session用于获取域名（挂载共享连接池，探测建立的连接可直接被登录复用）
+            session = create_session()
+            
+            # 获取域名列表的同时预解析备用域名
+            prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='prefetch')
+            prefetch_pool.submit(prefetch_dns, self.backup_domains)
+            try:
+                domain_list = self.fetch_domain_list(session)
+            except Exception as e:
+                logger.error(f"获取域名过程异常: {str(e)}", exc_info=True)
+                domain_list = []
+            prefetch_pool.shutdown(wait=False)
+            
+            # 探测前并发解析所有候选域名，避免逐个探测时串行等待DNS
+            prefetch_dns(domain_list)
+            
+            return select_domain(session, self.headers, domain_list, self.backup_domains, self.probe_path, self.scorer)
+
+    def create_job(self, account: Dict[str, str], domain: str) -> CheckInJob:
+        """为账户创建签到任务"""
+        return self.job_class(account['phone'], account['password'], domain, site=self)
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+性能分析
+
+开启后（--profile 或 QL_PROFILE=1 / SLGJ_PROFILE=1）记录 cProfile 统计、tracemalloc 内存分配热点，
+以及各阶段（域名获取、登录、余额、签到、报告、通知等）的墙钟时间与CPU时间。
+cProfile 和 CPU 时间只覆盖调用线程，因此开启时域名获取和签到后余额刷新改为在主线程中串行执行。
+常驻模式下每天的签到单独生成一份结果。
+关闭时 phase() 返回共享的空上下文，几乎没有额外开销。
+"""
+import os
+import time
+import cProfile
+import logging
+import threading
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .config import get_setting
+
+logger = logging.getLogger('ql_runner')
+
+_NULL_PHASE = nullcontext()
+
+class Profiler:
+    """一次运行的性能分析数据"""
+
+    def __init__(self, output_dir: str, top_allocations: int = 15):
+        self.output_dir = output_dir
+        self.top_allocations = top_allocations
+        self.phases: Dict[str, List[float]] = {}  # 阶段 -> [次数, 墙钟秒数, CPU秒数]
+        self._lock = threading.Lock()
+        self._profile = cProfile.Profile()
+        self._started_tracemalloc = False
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._profile.enable()
+
+    @contextmanager
+    def phase(self, name: str):
+        """记录一个阶段的墙钟时间和当前线程的CPU时间（嵌套阶段的时间计入外层）"""
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            with self._lock:
+                stat = self.phases.setdefault(name, [0, 0.0, 0.0])
+                stat[0] += 1
+                stat[1] += wall
+                stat[2] += cpu
+
+    def phase_table(self) -> str:
+        """各阶段墙钟时间与CPU时间对比表"""
+        from .report import format_table
+        rows = []
+        for name, (count, wall, cpu) in sorted(self.phases.items(), key=lambda item: -item[1][1]):
+            wait = max(wall - cpu, 0.0)
+            rows.append([name, str(count), f"{wall:.3f}", f"{cpu:.3f}", f"{wait:.3f}",
+                         f"{wait / wall * 100:.0f}%" if wall else "-"])
+        return format_table(['阶段', '次数', '墙钟(秒)', 'CPU(秒)', '等待(秒)', '等待占比'], rows)
+
+    def stop(self) -> Optional[str]:
+        """停止分析并写入结果文件，返回文件名前缀"""
+        self._profile.disable()
+        snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        
+        prefix = os.path.join(self.output_dir, f"ql_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        try:
+            self._profile.dump_stats(prefix + '.pstats')
+            
+            lines = []
+            if snapshot:
+                snapshot = snapshot.filter_traces([
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+                    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+                ])
+                for stat in snapshot.statistics('lineno')[:self.top_allocations]:
+                    lines.append(f"{stat.size / 1024:.1f} KiB, {stat.count} 块: {stat.traceback}")
+            
+            table = self.phase_table()
+            with open(prefix + '.txt', 'w', encoding='utf-8') as f:
+                f.write("各阶段耗时（墙钟 vs CPU）\n")
+                f.write(table + "\n\n")
+                f.write(f"内存分配 Top {self.top_allocations}\n")
+                f.write("\n".join(lines) + "\n")
+        except Exception as e:
+            logger.warning(f"写入性能分析结果失败: {e}")
+            return None
+        
+        print("\n" + "=" * 120)
+        print("⏱️ 性能分析")
+        print("=" * 120)
+        print(table)
+        print(f"\n内存分配 Top {min(5, len(lines))}:")
+        for line in lines[:5]:
+            print(f"  {line}")
+        logger.info(f"性能分析结果: {prefix}.pstats（可用 python -m pstats 查看）, {prefix}.txt")
+        return prefix
+
+_profiler: Optional[Profiler] = None
+
+def phase(name: str):
+    """阶段计时上下文；未开启性能分析时返回空上下文"""
+    if _profiler is None:
+        return _NULL_PHASE
+    return _profiler.phase(name)
+
+def is_profiling() -> bool:
+    """是否正在进行性能分析"""
+    return _profiler is not None
+
+def start_profiling(output_dir: str) -> Profiler:
+    """开启性能分析"""
+    global _profiler
+    _profiler = Profiler(output_dir)
+    _profiler.start()
+    logger.info("已开启性能分析")
+    return _profiler
+
+def stop_profiling() -> Optional[str]:
+    """停止性能分析并输出结果"""
+    global _profiler
+    if _profiler is None:
+        return None
+    profiler, _profiler = _profiler, None
+    return profiler.stop()
+
+def is_profile_mode(argv: List[str]) -> bool:
+    """命令行包含 --profile 或 QL_PROFILE / 站点前缀 PROFILE 设为1时开启性能分析"""
+    return '--profile' in argv or get_setting('PROFILE') == '1'
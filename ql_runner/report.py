@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""结果表格与合并报告"""
+import logging
+from typing import List, Optional
+
+from .engine import RunBudget, SiteRun
+from .notification import send_notification
+from .plugin import mask_phone
+from .profiling import phase
+from .transport import time_to_first_request
+
+logger = logging.getLogger('ql_runner')
+
+def format_table(headers: List[str], rows: List[List[str]]) -> str:
+    """
+    使用 Markdown 风格生成表格文字。
+    返回的字符串适合直接打印或用作通知内容。
+    """
+    # 构建表头和分隔行
+    header_line = "| " + " | ".join(headers) + " |"
+    separator_line = "| " + " | ".join("---" for _ in headers) + " |"
+
+    # 构建数据行
+    data_lines = []
+    for row in rows:
+        data_lines.append("| " + " | ".join(str(cell) for cell in row) + " |")
+
+    return "\n".join([header_line, separator_line] + data_lines)
+
+def report_results(runs: List[SiteRun], budget: Optional[RunBudget] = None):
+    """打印所有站点的合并结果表格和统计信息，并发送一次通知"""
+    multi_site = len(runs) > 1
+    all_results = [result for run in runs for result in run.results]
+    
+    # 生成结果表格
+    print("\n" + "=" * 120)
+    print("🎯 所有账户签到情况统计表")
+    print("=" * 120)
+    
+    # 准备表格数据（多个站点时增加站点列）
+    table_headers = ['序号', '手机号', '昵称', '状态', '余额(¥)', '增加(¥)', '详情']
+    if multi_site:
+        table_headers.insert(1, '站点')
+    table_data = []
+    
+    idx = 0
+    for run in runs:
+        for result in run.results:
+            idx += 1
+            # 截断长消息以适应表格
+            detail = result['message'][:40] + ('...' if len(result['message']) > 40 else '')
+            
+            row = [
+                str(idx),
+                mask_phone(result['phone']),
+                result['nickname'][:10],  # 昵称不超过10个字符
+                result['status'],
+                f"¥{result['balance']:.2f}",
+                f"¥{result['increase']:.2f}",
+                detail
+            ]
+            if multi_site:
+                row.insert(1, run.site.name)
+            table_data.append(row)
+    
+    # 打印表格
+    table_output = format_table(table_headers, table_data)
+    print(table_output)
+    
+    # 统计信息（不含汇总金额）
+    success_count = sum(1 for r in all_results if r['status'] == '成功')
+    fail_count = sum(1 for r in all_results if r['status'] == '失败')
+    error_count = sum(1 for r in all_results if r['status'] == '异常')
+    deferred_count = sum(1 for r in all_results if r['status'] == '延后')
+    budget_text = budget.describe() if budget else '未设置'
+    domain_lines = []
+    for run in runs:
+        label = f"{run.site.name} " if multi_site else ''
+        domain_lines.append(f"{label}域名: {run.domain} (评分: {run.site.scorer.describe(run.domain)})")
+    
+    print("\n" + "=" * 120)
+    print("📊 执行统计")
+    print("=" * 120)
+    logger.info(f"总账户数: {len(all_results)}")
+    logger.info(f"成功: {success_count} ✅")
+    logger.info(f"失败: {fail_count} ❌")
+    logger.info(f"异常: {error_count} ⚠️")
+    logger.info(f"延后: {deferred_count} ⏳")
+    logger.info(f"时间预算: {budget_text}")
+    for line in domain_lines:
+        logger.info(line)
+    ttfr = time_to_first_request()
+    ttfr_text = f"{ttfr:.2f}秒" if ttfr is not None else "未发出"
+    logger.info(f"首个请求耗时: {ttfr_text}")
+    print("=" * 120)
+    
+    # 保存本次运行中更新的域名评分
+    for run in runs:
+        run.site.scorer.save()
+    
+    # 发送表格通知（表格内容包含所有详细信息）
+    summary = f"总数: {len(all_results)} | 成功: {success_count} | 失败: {fail_count} | 异常: {error_count} | 延后: {deferred_count}"
+    details = "\n".join([f"时间预算: {budget_text}"] + domain_lines + [f"首个请求耗时: {ttfr_text}"])
+    notification_msg = f"批量签到完成\n\n{summary}\n{details}\n\n{table_output}"
+    with phase('notification'):
+        send_notification("📊 签到统计报告", notification_msg)
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+签到运行器
+
+在一个解释器内执行一个或多个站点的签到：所有站点共享连接池、调度和时间预算，
+最后只生成一份合并报告、发送一次通知。
+"""
+import os
+import sys
+import time
+import logging
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from .config import get_int_setting, get_setting, set_site_prefixes
+from .daemon import run_daemon
+from .engine import SiteRun, load_run_budget, process_accounts
+from .plugin import Site
+from .profiling import is_profile_mode, phase, start_profiling, stop_profiling
+from .report import report_results
+from .transport import PROCESS_START, install_dns_cache, uninstall_dns_cache, warm_up_in_background
+
+logger = logging.getLogger('ql_runner')
+
+def setup_logging():
+    """配置日志格式（与各签到脚本一致）"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+def load_site(path: str) -> Site:
+    """从脚本文件加载站点插件，脚本需定义模块级变量 SITE"""
+    module_name = f"ql_site_{abs(hash(os.path.abspath(path)))}"
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"无法加载站点脚本: {path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    site = getattr(module, 'SITE', None)
+    if not isinstance(site, Site):
+        raise ImportError(f"站点脚本未定义 SITE: {path}")
+    return site
+
+def run_sites(sites: List[Site], daemon: bool = False, profile: bool = False):
+    """
+    执行多个站点的签到任务，profile 为 True 时输出性能分析结果
+    （常驻模式下每天的签到单独输出一份，而不是覆盖整个进程生命周期）
+    """
+    set_site_prefixes(site.env_prefix for site in sites)
+    # 站点前缀注册后再检查一次，调用方未注册前缀时站点前缀的 DAEMON / PROFILE 变量同样生效
+    daemon = daemon or get_setting('DAEMON') == '1'
+    profile = profile or get_setting('PROFILE') == '1'
+    profile_dir = get_setting('PROFILE_DIR') or sites[0].state_dir
+    if profile and not daemon:
+        start_profiling(profile_dir)
+    install_dns_cache()
+    try:
+        # 启动流水线：已配置账户的站点立即在后台开始获取域名（含DNS预解析），与账户解析并行；
+        # 性能分析时改为在主线程中获取，使其计入 cProfile 统计
+        domain_futures = {}
+        if not daemon and not profile:
+            startup_pool = ThreadPoolExecutor(max_workers=max(1, len(sites)), thread_name_prefix='startup')
+            domain_futures = {id(site): startup_pool.submit(site.discover_domain)
+                              for site in sites if site.accounts_configured()}
+            startup_pool.shutdown(wait=False)
+        
+        runs = []
+        for site in sites:
+            accounts = site.load_accounts()
+            if accounts:
+                logger.info(f"[{site.name}] 检测到 {len(accounts)} 个账户")
+                runs.append(SiteRun(site, accounts))
+            elif id(site) in domain_futures:
+                domain_futures[id(site)].cancel()
+        
+        if not runs:
+            logger.error("无法解析任何有效的账户信息")
+            sys.exit(1)
+        
+        if daemon:
+            run_daemon(runs, profile_dir if profile else None)
+            return
+        
+        # 时间预算从进程启动开始计算，包含域名获取耗时
+        budget = load_run_budget(PROCESS_START)
+        warm_count = get_int_setting('WARM_CONNECTIONS', 2)
+        
+        for run in runs:
+            # 先获取一次可用域名，站点内所有账户共用
+            logger.info("\n" + "🌐" * 35)
+            logger.info(f"[{run.site.name}] 获取可用域名（全部账户共用）")
+            logger.info("🌐" * 35)
+            
+            future = domain_futures.get(id(run.site))
+            run.domain = future.result() if future else run.site.discover_domain()
+            logger.info(f"✅ 获取到可用域名: {run.domain} (耗时 {time.perf_counter() - PROCESS_START:.2f}秒)")
+            logger.info(f"   域名评分: {run.site.scorer.describe(run.domain)}")
+            logger.info("=" * 70)
+            
+            # 探测已在连接池中留下一条连接供首个账户登录使用，其余连接在后台预热
+            warm_up_in_background(run.site.probe_url(run.domain), run.site.headers,
+                                  min(warm_count, len(run.accounts)))
+            
+            run.results = process_accounts(run.site, run.accounts, run.domain, budget=budget)
+        
+        with phase('reporting'):
+            report_results(runs, budget)
+        
+    except KeyboardInterrupt:
+        logger.info("\n用户中断执行")
+    except Exception as e:
+        logger.error(f"程序执行异常: {str(e)}", exc_info=True)
+        sys.exit(1)
+    finally:
+        stop_profiling()
+        uninstall_dns_cache()
+
+def is_daemon_mode(argv: List[str]) -> bool:
+    """命令行包含 --daemon 或 QL_DAEMON / 站点前缀 DAEMON 设为1时以常驻模式运行"""
+    return '--daemon' in argv or get_setting('DAEMON') == '1'
+
+def main(argv: Optional[List[str]] = None):
+    """
+    命令行入口
+    python3 -m ql_runner [--daemon] [--profile] 脚本1.py 脚本2.py ...
+    未指定脚本时读取 QL_RUNNER_SITES（逗号分隔的脚本路径）
+    """
+    setup_logging()
+    argv = sys.argv[1:] if argv is None else argv
+    paths = [arg for arg in argv if not arg.startswith('--')]
+    if not paths:
+        paths = [p.strip() for p in os.environ.get('QL_RUNNER_SITES', '').split(',') if p.strip()]
+    if not paths:
+        logger.error("请指定站点脚本，或设置 QL_RUNNER_SITES")
+        sys.exit(1)
+    
+    sites = []
+    for path in paths:
+        try:
+            sites.append(load_site(path))
+            logger.info(f"已加载站点: {sites[-1].name} ({path})")
+        except Exception as e:
+            logger.error(f"加载站点失败 {path}: {e}", exc_info=True)
+    if not sites:
+        sys.exit(1)
+    
+    set_site_prefixes(site.env_prefix for site in sites)
+    run_sites(sites, daemon=is_daemon_mode(argv), profile=is_profile_mode(argv))
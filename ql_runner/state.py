@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""跨运行状态文件（域名评分、账户历史、常驻模式检查点）的读写"""
+import os
+import json
+import logging
+from typing import Any, Optional
+
+logger = logging.getLogger('ql_runner')
+
+def load_json(path: str, description: str) -> Optional[Any]:
+    """读取状态文件，文件不存在或损坏时返回 None"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"加载{description}失败，将重新开始: {e}")
+        return None
+
+def save_json(path: str, data: Any, description: str):
+    """写入状态文件（先写临时文件再替换，避免中断导致文件损坏）"""
+    try:
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"保存{description}失败: {e}")
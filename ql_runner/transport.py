@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+共享网络传输层
+
+所有站点、所有账户的session挂载同一个连接池适配器，复用已建立的TLS长连接（cookie仍按session隔离）；
+另提供DNS预解析、连接预热和首个请求耗时统计。
+
+DNS预解析结果通过替换 socket.getaddrinfo 生效：运行器在 run_sites() 开始时调用 install_dns_cache()、
+结束时调用 uninstall_dns_cache()。替换后的函数只对 prefetch_dns() 解析过且未过期的 (主机, 端口) 返回缓存，
+其他主机（如通知推送）仍直接调用原始的 getaddrinfo。
+"""
+import time
+import socket
+import logging
+import threading
+import requests
+import urllib3
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+from typing import Dict, Any, Optional, List, Tuple
+
+# 禁用SSL警告和urllib3的警告
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+logger = logging.getLogger('ql_runner')
+
+# 进程启动时间，用于统计首个签到请求耗时
+PROCESS_START = time.perf_counter()
+
+# 共享连接池
+_shared_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+
+def create_session() -> requests.Session:
+    """创建挂载共享连接池的session"""
+    session = requests.Session()
+    session.mount('https://', _shared_adapter)
+    session.mount('http://', _shared_adapter)
+    return session
+
+# DNS预解析缓存：(host, port, family, type) -> (过期时间, 解析结果)
+_DNS_TTL = 300
+_dns_cache: Dict[Tuple, Tuple[float, Any]] = {}
+_dns_lock = threading.Lock()
+_original_getaddrinfo = socket.getaddrinfo
+
+def _cached_getaddrinfo(host, port, *args, **kwargs):
+    """优先使用预解析结果的getaddrinfo"""
+    if not kwargs:
+        entry = _dns_cache.get((host, port) + args)
+        if entry and entry[0] > time.time():
+            return entry[1]
+    return _original_getaddrinfo(host, port, *args, **kwargs)
+
+def install_dns_cache():
+    """启用DNS预解析缓存（替换 socket.getaddrinfo）"""
+    socket.getaddrinfo = _cached_getaddrinfo
+
+def uninstall_dns_cache():
+    """恢复原始的 socket.getaddrinfo 并清空缓存"""
+    if socket.getaddrinfo is _cached_getaddrinfo:
+        socket.getaddrinfo = _original_getaddrinfo
+    with _dns_lock:
+        _dns_cache.clear()
+
+def _domain_host_port(domain: str) -> Tuple[str, int]:
+    parsed = urlparse(domain if '://' in domain else f"https://{domain}")
+    port = parsed.port or (80 if parsed.scheme == 'http' else 443)
+    return parsed.hostname or '', port
+
+def prefetch_dns(domains: List[str]) -> int:
+    """并发预解析域名，返回成功解析的数量；结果仅在 install_dns_cache() 之后被连接使用"""
+    targets = {_domain_host_port(d) for d in domains}
+    targets = {t for t in targets if t[0]}
+    if not targets:
+        return 0
+    
+    family = urllib3.util.connection.allowed_gai_family()
+    
+    def _resolve(target: Tuple[str, int]) -> bool:
+        host, port = target
+        try:
+            result = _original_getaddrinfo(host, port, family, socket.SOCK_STREAM)
+        except OSError as e:
+            logger.debug(f"DNS预解析失败 {host}: {e}")
+            return False
+        with _dns_lock:
+            _dns_cache[(host, port, family, socket.SOCK_STREAM)] = (time.time() + _DNS_TTL, result)
+        return True
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(targets)), thread_name_prefix='dns') as pool:
+        resolved = sum(pool.map(_resolve, targets))
+    logger.debug(f"DNS预解析完成: {resolved}/{len(targets)}")
+    return resolved
+
+def warm_up_connections(url: str, headers: Dict[str, str], count: int) -> int:
+    """并发向目标地址发起轻量请求，在共享连接池中预先建立多条keep-alive连接"""
+    if count <= 0:
+        return 0
+    session = create_session()
+    
+    def _open(_) -> bool:
+        try:
+            session.options(url, headers=headers, timeout=5, verify=False)
+            return True
+        except Exception:
+            return False
+    
+    with ThreadPoolExecutor(max_workers=count, thread_name_prefix='warmup') as pool:
+        opened = sum(pool.map(_open, range(count)))
+    logger.info(f"已预热 {opened}/{count} 条连接: {url}")
+    return opened
+
+def warm_up_in_background(url: str, headers: Dict[str, str], count: int):
+    """在后台预热连接，不阻塞首个账户登录"""
+    threading.Thread(
+        target=warm_up_connections,
+        args=(url, headers, count),
+        name='warmup',
+        daemon=True
+    ).start()
+
+class RateLimiter:
+    """请求限速：保证相邻两次请求的开始时间间隔不小于 1/rate 秒（线程安全）"""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+# 首个签到相关请求（登录）发出的时间，以及计时起点（单次运行为进程启动，常驻模式为每日签到开始）
+_first_request_at: Optional[float] = None
+_measure_start = PROCESS_START
+
+def reset_first_request():
+    """重新开始统计首个请求耗时，计时起点为当前时间（常驻模式每日签到开始时调用）"""
+    global _first_request_at, _measure_start
+    _first_request_at = None
+    _measure_start = time.perf_counter()
+
+def mark_first_request():
+    """记录首个登录请求的发出时间"""
+    global _first_request_at
+    if _first_request_at is None:
+        _first_request_at = time.perf_counter()
+
+def time_to_first_request() -> Optional[float]:
+    """从计时起点到首个登录请求发出的秒数"""
+    if _first_request_at is None:
+        return None
+    return _first_request_at - _measure_start
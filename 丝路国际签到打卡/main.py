@@ -4,25 +4,40 @@
 name: 丝路国际签到打卡脚本
 环境变量配置：
 SLGJ_USER: phone=手机号&password=密码
+SLGJ_STATE_DIR: 状态文件目录（可选，默认脚本所在目录）
+SLGJ_EXPLORE_RATE: 域名探索比例（可选，默认0.1）
+SLGJ_WARM_CONNECTIONS: 预热的长连接数（可选，默认2）
+SLGJ_DAEMON: 设为1时以常驻模式运行（等同于 --daemon 参数）
+SLGJ_DEADLINE: 单次运行时间预算，如 300s / 5m（可选，默认不限时）
+SLGJ_PROFILE: 设为1时输出性能分析结果（等同于 --profile 参数）
 cron: 0,10 9 * * *
 
 说明：
   - 脚本通过一个环境变量`SLGJ_USER`获取账号信息。
   - 格式为`phone=手机号&password=密码`，会自动拆解为手机号码和密码。
+  - 通用部分（连接池、域名评分、调度、报告、通知）位于仓库根目录的 ql_runner 包，
+    部署时需保持 `ql_runner/` 与 `丝路国际签到打卡/` 位于同一目录下，
+    本脚本只包含站点相关的登录、余额和签到步骤，也可与其他站点一起通过 `python3 -m ql_runner` 运行。
 """
 import os
 import sys
 import json
 import time
-import random
 import logging
 import requests
-import urllib3
-from typing import Dict, Any, Optional, List, Tuple
-from datetime import datetime
+from typing import Dict, Any, Optional, List
+
+# 共享运行器位于仓库根目录（即本脚本所在目录的上一级），部署时需一并保留 ql_runner 目录
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from ql_runner import CheckInJob, Site, is_daemon_mode, is_profile_mode, run_sites, set_site_prefixes
+except ImportError as e:
+    print(f"❌ 无法导入共享运行器 ql_runner: {e}\n"
+          f"请将仓库中的 ql_runner 目录部署到 {os.path.dirname(os.path.dirname(os.path.abspath(__file__)))} 下"
+          f"（青龙面板订阅时在「依赖文件」中填写 ql_runner），详见 README 的定时任务配置", file=sys.stderr)
+    sys.exit(1)
 
-# 禁用SSL警告和urllib3的警告
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -34,119 +49,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger('YHCheckIn')
 
-# 通知推送函数（青龙面板环境）
-def send_notification(title: str, content: str):
-    """发送通知"""
-    try:
-        # 尝试导入青龙面板的通知模块
-        try:
-            from notify import send as ql_send
-            ql_send(f"{title}", content)
-            logger.info(f"已通过青龙通知发送: {title}")
-            return
-        except ImportError:
-            pass
-        
-        # 检查青龙面板环境变量
-        env_vars = {
-            'PUSH_PLUS_TOKEN': 'pushplus',
-            'BARK_PUSH': 'bark',
-            'TG_BOT_TOKEN': 'telegram',
-            'DD_BOT_TOKEN': '钉钉',
-            'FSKEY': '飞书'
-        }
-        
-        # 输出到日志，青龙面板会捕获
-        logger.info(f"【{title}】{content}")
-        
-        # 如果青龙面板有通知配置，这里可以添加推送逻辑
-        for env_var, platform in env_vars.items():
-            if os.environ.get(env_var):
-                logger.info(f"检测到{platform}通知配置，可在此处实现推送")
-                
-    except Exception as e:
-        logger.error(f"发送通知失败: {e}")
+# 默认请求头
+BASE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 18_7 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148 Html5Plus/1.0 (Immersed/59) uni-app',
+    'Accept-Language': 'zh-CN,zh-Hans;q=0.9',
+    'appVersion': '1.0.2.0',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Accept': '*/*',
+    'Connection': 'keep-alive'
+}
 
-def get_available_domain() -> str:
-    """获取可用的域名（主函数中使用）"""
-    logger.info("开始获取可用域名...")
-    
-    # 创建临时session用于获取域名
-    temp_session = requests.Session()
-    base_headers = {
-        'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 18_7 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148 Html5Plus/1.0 (Immersed/59) uni-app',
-        'Accept-Language': 'zh-CN,zh-Hans;q=0.9',
-        'appVersion': '1.0.2.0',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Accept': '*/*',
-        'Connection': 'keep-alive'
-    }
-    
-    timestamp = int(time.time() * 1000)
-    url = f"https://silugj-1322772389.cos.accelerate.myqcloud.com/yydsslgj.json?t={timestamp}"
-    logger.debug(f"请求域名接口: {url}")
-    
-    domain_list = []
-    try:
-        response = temp_session.get(
-            url,
-            headers=base_headers,
-            timeout=10,
-            verify=False
-        )
-        logger.info(f"域名接口响应状态: {response.status_code}")
-        if response.status_code == 200:
-            data = response.json()
-            logger.debug(f"域名接口返回数据: {json.dumps(data, ensure_ascii=False)}")
-            key_list = data.get('keyList', '')
-            if key_list:
-                domain_list = [d.strip() for d in key_list.split(',') if d.strip()]
-                logger.info(f"成功获取域名列表: {domain_list}")
-    except Exception as e:
-        logger.error(f"获取域名过程异常: {str(e)}", exc_info=True)
-    
-    # 尝试找到可用的域名
-    def _is_domain_alive(domain: str) -> bool:
-        try:
-            test_url = domain.rstrip('/') + "/app/sn-personal/insurance/user/login"
-            resp = temp_session.options(
-                test_url,
-                headers=base_headers,
-                timeout=5,
-                verify=False
-            )
-            return resp.status_code < 500
-        except Exception:
-            return False
-    
-    # 从获取的列表中挑选第一个可用的域名
-    random.shuffle(domain_list)
-    for dom in domain_list:
-        if _is_domain_alive(dom):
-            logger.info(f"选择可用域名: {dom}")
-            return dom
-        else:
-            logger.warning(f"域名不可用，跳过: {dom}")
-    
-    # 如果上面的都不可用，使用备用域名
-    backup_domains = [
-        "https://api.ockw6.com",
-        "https://api.skw68.com",
-        "https://api.yinhehapi.com"
-    ]
-    logger.info(f"尝试备用域名列表: {backup_domains}")
-    random.shuffle(backup_domains)
-    for dom in backup_domains:
-        if _is_domain_alive(dom):
-            logger.info(f"备用域名可用: {dom}")
-            return dom
-        else:
-            logger.warning(f"备用域名不可用: {dom}")
-    
-    # 最后一手段，返回第一个原始域名或备选
-    fallback = domain_list[0] if domain_list else backup_domains[0]
-    logger.warning(f"未找到可用域名，使用回退: {fallback}")
-    return fallback
+# 备用域名
+BACKUP_DOMAINS = [
+    "https://api.ockw6.com",
+    "https://api.skw68.com",
+    "https://api.yinhehapi.com"
+]
 
 def parse_multiple_accounts(user_env: str) -> List[Dict[str, str]]:
     """
@@ -192,138 +110,15 @@ def parse_multiple_accounts(user_env: str) -> List[Dict[str, str]]:
         logger.error(f"解析账户信息失败: {e}")
         return []
 
-def format_table(headers: List[str], rows: List[List[str]]) -> str:
-    """
-    使用 Markdown 风格生成表格文字。
-    返回的字符串适合直接打印或用作通知内容。
-    """
-    # 构建表头和分隔行
-    header_line = "| " + " | ".join(headers) + " |"
-    separator_line = "| " + " | ".join("---" for _ in headers) + " |"
-
-    # 构建数据行
-    data_lines = []
-    for row in rows:
-        data_lines.append("| " + " | ".join(str(cell) for cell in row) + " |")
-
-    return "\n".join([header_line, separator_line] + data_lines)
-
-class YHCheckIn:
-    def __init__(self, phone: str, password: str, base_url: str = ""):
-        # 直接使用传入的爲证信息
-        self.username = phone.strip()
-        self.password = password.strip()
-        
-        if not self.username or not self.password:
-            error_msg = "错误: 账户信息不完整"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
+class YHCheckIn(CheckInJob):
+    def __init__(self, phone: str, password: str, base_url: str = "", site: Optional[Site] = None):
+        super().__init__(phone, password, base_url, site or SITE)
         
         logger.info(f"初始化签到脚本，用户: {self.username[:3]}****{self.username[-4:]}")
         
-        # 初始化session
-        self.session = requests.Session()
-        
-        # 默认请求头
-        self.base_headers = {
-            'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 18_7 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148 Html5Plus/1.0 (Immersed/59) uni-app',
-            'Accept-Language': 'zh-CN,zh-Hans;q=0.9',
-            'appVersion': '1.0.2.0',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Accept': '*/*',
-            'Connection': 'keep-alive'
-        }
-        
-        self.base_url = base_url  # 使用传入的域名
         self.user_info = {}
         self.token = ""
-        self.domain_list = []
         self.balance_info = {}  # 存储余额信息
-        self.check_in_result = {  # 签到结果
-            'phone': self.username,
-            'nickname': '未知',
-            'status': '未开始',
-            'message': '',
-            'balance': 0,
-            'increase': 0,
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
-        
-    def _is_domain_alive(self, domain: str) -> bool:
-        """简单检测给定域名是否可用"""
-        try:
-            # 测试登录接口是否响应（不带有效数据）
-            test_url = domain.rstrip('/') + "/app/sn-personal/insurance/user/login"
-            resp = self.session.options(
-                test_url,
-                headers=self.base_headers,
-                timeout=5,
-                verify=False
-            )
-            # 只要不是服务器错误即可认为可用
-            return resp.status_code < 500
-        except Exception:
-            return False
-
-    def get_random_domain(self) -> str:
-        """获取随机且可用的域名"""
-        logger.info("开始获取可用域名...")
-        timestamp = int(time.time() * 1000)
-        url = f"https://silugj-1322772389.cos.accelerate.myqcloud.com/yydsslgj.json?t={timestamp}"
-        logger.debug(f"请求域名接口: {url}")
-        try:
-            response = self.session.get(
-                url,
-                headers=self.base_headers,
-                timeout=10,
-                verify=False
-            )
-            logger.info(f"域名接口响应状态: {response.status_code}")
-            if response.status_code == 200:
-                data = response.json()
-                logger.debug(f"域名接口返回数据: {json.dumps(data, ensure_ascii=False)}")
-                key_list = data.get('keyList', '')
-                if key_list:
-                    self.domain_list = [d.strip() for d in key_list.split(',') if d.strip()]
-                    logger.info(f"成功获取域名列表: {self.domain_list}")
-            else:
-                logger.warning(f"域名接口请求失败: HTTP {response.status_code}")
-                logger.debug(f"响应内容: {response.text}")
-        except requests.exceptions.Timeout:
-            logger.error("获取域名请求超时")
-        except requests.exceptions.ConnectionError:
-            logger.error("获取域名连接错误")
-        except Exception as e:
-            logger.error(f"获取域名过程异常: {str(e)}", exc_info=True)
-
-        # 从列表中挑选第一个可用的域名
-        random.shuffle(self.domain_list)
-        for dom in self.domain_list:
-            if self._is_domain_alive(dom):
-                logger.info(f"选择可用域名: {dom}")
-                return dom
-            else:
-                logger.warning(f"域名不可用，跳过: {dom}")
-
-        # 如果所有获取的域名不可用，则使用备用域名并验证
-        backup_domains = [
-            "https://api.ockw6.com",
-            "https://api.skw68.com",
-            "https://api.yinhehapi.com"
-        ]
-        logger.info(f"尝试备用域名列表: {backup_domains}")
-        random.shuffle(backup_domains)
-        for dom in backup_domains:
-            if self._is_domain_alive(dom):
-                logger.info(f"备用域名可用: {dom}")
-                return dom
-            else:
-                logger.warning(f"备用域名不可用: {dom}")
-
-        # 最后一手段，返回第一个原始域名或备选
-        fallback = self.domain_list[0] if self.domain_list else backup_domains[0]
-        logger.warning(f"未找到可用域名，使用回退: {fallback}")
-        return fallback
     
     def login(self) -> bool:
         """登录账号"""
@@ -362,10 +157,11 @@ class YHCheckIn:
                 login_url,
                 headers=headers,
                 json=login_data,
-                timeout=15,
+                timeout=self.request_timeout,
                 verify=False
             )
             request_time = time.time() - start_time
+            self.site.scorer.record_outcome(self.base_url, response.status_code < 500)
             
             logger.info(f"登录请求耗时: {request_time:.2f}秒")
             logger.info(f"登录响应状态: {response.status_code}")
@@ -390,6 +186,7 @@ class YHCheckIn:
                         self.token = data.get('token', '')
                         
                         if self.token:
+                            self.check_in_result['nickname'] = self.user_info.get('nickName') or '未知'
                             logger.info("=" * 50)
                             logger.info("登录成功!")
                             logger.info(f"用户ID: {self.user_info['userId']}")
@@ -420,10 +217,12 @@ class YHCheckIn:
             return False
             
         except requests.exceptions.Timeout:
+            self.site.scorer.record_outcome(self.base_url, False)
             logger.error("登录请求超时")
             self.check_in_result['status'] = '异常'
             self.check_in_result['message'] = '请求超时'
         except requests.exceptions.ConnectionError:
+            self.site.scorer.record_outcome(self.base_url, False)
             logger.error("登录连接错误")
             self.check_in_result['status'] = '异常'
             self.check_in_result['message'] = '连接错误'
@@ -465,7 +264,7 @@ class YHCheckIn:
                 wallet_url,
                 headers=headers,
                 json=wallet_data,
-                timeout=15,
+                timeout=self.request_timeout,
                 verify=False
             )
             request_time = time.time() - start_time
@@ -553,7 +352,7 @@ class YHCheckIn:
                 checkin_url,
                 headers=headers,
                 json=checkin_data,
-                timeout=15,
+                timeout=self.request_timeout,
                 verify=False
             )
             request_time = time.time() - start_time
@@ -589,23 +388,15 @@ class YHCheckIn:
                         logger.info(f"🎉 签到成功!")
                         logger.info(f"📝 消息: {detail_msg}")
                         
-                        # 签到后重新获取余额，看是否有变化
-                        old_balance = self.balance_info.get('cnyWithdrawableBalance', 0)
-                        new_balance_info = self.get_user_wallet_balance()
-                        new_balance = new_balance_info.get('cnyWithdrawableBalance', 0)
-                        
-                        if new_balance > old_balance:
-                            increase = new_balance - old_balance
-                            logger.info(f"💰 余额增加: ¥{increase:.2f}")
-                            logger.info(f"💰 当前可提现余额: ¥{new_balance:.2f}")
-                            self.check_in_result['increase'] = increase
+                        # 签到后余额在所有账户签到完成后统一刷新
+                        self.needs_balance_refresh = True
+                        self.check_in_result['balance'] = self.balance_info.get('cnyWithdrawableBalance', 0)
                         
                         logger.info("=" * 50)
                         
                         # 更新签到结果
                         self.check_in_result['status'] = '成功'
                         self.check_in_result['message'] = detail_msg
-                        self.check_in_result['balance'] = new_balance
                         
                         return True
                     else:
@@ -645,54 +436,31 @@ class YHCheckIn:
             self.check_in_result['message'] = str(e)
         return False
     
-    def run(self) -> Dict[str, Any]:
-        """执行签到流程，返回结果"""
-        print("=" * 70)
-        logger.info(f"开始处理账号: {self.username[:3]}****{self.username[-4:]}")
-        logger.info(f"当前时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("=" * 70)
-        
-        # 步骤1: 登录
-        logger.info("\n" + "📱" * 10 + " 开始登录 " + "📱" * 10)
-        if not self.login():
-            self.check_in_result['status'] = '失败'
-            if not self.check_in_result['message']:
-                self.check_in_result['message'] = '登录失败'
-            return self.check_in_result
-        
-        # 步骤2: 获取签到前的余额
-        logger.info("\n" + "💰" * 10 + " 获取签到前余额 " + "💰" * 10)
-        self.get_user_wallet_balance()
-        self.check_in_result['nickname'] = self.user_info.get('nickName', '未知')
-        self.check_in_result['balance'] = self.balance_info.get('cnyWithdrawableBalance', 0)
-        
-        # 步骤3: 签到
-        logger.info("\n" + "✅" * 10 + " 开始签到 " + "✅" * 10)
-        success = self.check_in()
-        
-        print("\n" + "=" * 70)
-        if success:
-            logger.info("🎉 签到流程完成 - 成功 🎉")
-        else:
-            logger.info("❌ 签到流程完成 - 失败 ❌")
-        print("=" * 70)
-        
-        # 输出总结信息
-        logger.info(f"\n📊 执行总结:")
-        logger.info(f"  账号: {self.username[:3]}****{self.username[-4:]}")
-        logger.info(f"  昵称: {self.check_in_result['nickname']}")
-        logger.info(f"  使用域名: {self.base_url}")
-        logger.info(f"  当前可提现余额: ¥{self.check_in_result['balance']:.2f}")
-        logger.info(f"  执行时间: {self.check_in_result['timestamp']}")
-        logger.info(f"  签到结果: {self.check_in_result['status']}")
-        if self.check_in_result['message']:
-            logger.info(f"  详情: {self.check_in_result['message']}")
-        
-        return self.check_in_result
+    def get_balance(self) -> Optional[float]:
+        """签到前余额（可提现余额）"""
+        if not self.get_user_wallet_balance():
+            return None
+        return self.balance_info.get('cnyWithdrawableBalance', 0)
+    
+    def sign_in(self) -> bool:
+        """签到"""
+        return self.check_in()
 
-def main():
-    """主函数 - 支持多账户处理"""
-    try:
+class SlgjSite(Site):
+    """丝路国际"""
+    name = '丝路国际'
+    key = 'slgj'
+    probe_path = '/app/sn-personal/insurance/user/login'
+    backup_domains = BACKUP_DOMAINS
+    headers = BASE_HEADERS
+    job_class = YHCheckIn
+
+    def accounts_configured(self) -> bool:
+        """是否设置了 SLGJ_USER"""
+        return bool(os.environ.get('SLGJ_USER', '').strip())
+
+    def load_accounts(self) -> List[Dict[str, str]]:
+        """从 SLGJ_USER 读取账户"""
         # 检查环境变量
         if 'SLGJ_USER' not in os.environ:
             logger.warning("=" * 60)
@@ -700,112 +468,49 @@ def main():
             logger.warning("    SLGJ_USER: phone=手机号&password=密码")
             logger.warning("    支持多账户: phone=号1&password=密码1&phone=号2&password=密码2")
             logger.warning("=" * 60)
-            sys.exit(1)
-        
-        user_env = os.environ.get('SLGJ_USER', '').strip()
-        
-        # 解析多个账户
-        accounts = parse_multiple_accounts(user_env)
-        
-        if not accounts:
-            logger.error("无法解析任何有效的账户信息")
-            sys.exit(1)
-        
-        logger.info(f"检测到 {len(accounts)} 个账户，开始处理...")
-        
-        # 先获取一次可用域名，所有账户共用
-        logger.info("\n" + "🌐" * 35)
-        logger.info("第一步：获取可用域名（全部账户共用）")
-        logger.info("🌐" * 35)
-        
-        available_domain = get_available_domain()
-        logger.info(f"✅ 获取到可用域名: {available_domain}")
-        logger.info("=" * 70)
-        
-        # 存储所有结果
-        all_results = []
-        
-        # 为每个账户执行签到
-        for idx, account in enumerate(accounts, 1):
-            logger.info("\n" + "🔄" * 35)
-            logger.info(f"处理账户 {idx}/{len(accounts)}: {account['phone'][:3]}****{account['phone'][-4:]}")
-            logger.info("🔄" * 35)
-            
-            try:
-                # 使用获取到的域名初始化账户检查器
-                checker = YHCheckIn(account['phone'], account['password'], available_domain)
-                result = checker.run()
-                all_results.append(result)
-                
-                # 账户间延迟，避免请求过快
-                if idx < len(accounts):
-                    delay = random.randint(3, 8)
-                    logger.info(f"等待 {delay} 秒后处理下一个账户...")
-                    time.sleep(delay)
-                    
-            except Exception as e:
-                logger.error(f"处理第 {idx} 个账户失败: {str(e)}", exc_info=True)
-                all_results.append({
-                    'phone': account['phone'],
-                    'nickname': '未知',
-                    'status': '异常',
-                    'message': str(e)[:50],
-                    'balance': 0,
-                    'increase': 0,
-                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                })
-        
-        # 生成结果表格
-        print("\n" + "=" * 120)
-        print("🎯 所有账户签到情况统计表")
-        print("=" * 120)
-        
-        # 准备表格数据
-        table_headers = ['序号', '手机号', '昵称', '状态', '余额(¥)', '增加(¥)', '详情']
-        table_data = []
-        
-        for idx, result in enumerate(all_results, 1):
-            phone = result['phone']
-            # 截断长消息以适应表格
-            detail = result['message'][:40] + ('...' if len(result['message']) > 40 else '')
-            
-            table_data.append([
-                str(idx),
-                f"{phone[:3]}****{phone[-4:]}",
-                result['nickname'][:10],  # 昵称不超过10个字符
-                result['status'],
-                f"¥{result['balance']:.2f}",
-                f"¥{result['increase']:.2f}",
-                detail
-            ])
-        
-        # 打印表格
-        table_output = format_table(table_headers, table_data)
-        print(table_output)
-        
-        # 统计信息（不含汇总金额）
-        success_count = sum(1 for r in all_results if r['status'] == '成功')
-        fail_count = sum(1 for r in all_results if r['status'] == '失败')
-        error_count = sum(1 for r in all_results if r['status'] == '异常')
-        
-        print("\n" + "=" * 120)
-        print("📊 执行统计")
-        print("=" * 120)
-        logger.info(f"总账户数: {len(all_results)}")
-        logger.info(f"成功: {success_count} ✅")
-        logger.info(f"失败: {fail_count} ❌")
-        logger.info(f"异常: {error_count} ⚠️")
-        print("=" * 120)
-        
-        # 发送表格通知（表格内容包含所有详细信息）
-        notification_msg = f"批量签到完成\n\n总数: {len(all_results)} | 成功: {success_count} | 失败: {fail_count} | 异常: {error_count}\n\n{table_output}"
-        send_notification("📊 签到统计报告", notification_msg)
+            return []
+        return parse_multiple_accounts(os.environ.get('SLGJ_USER', '').strip())
+
+    def fetch_domain_list(self, session: requests.Session) -> List[str]:
+        """从COS获取域名列表"""
+        timestamp = int(time.time() * 1000)
+        url = f"https://silugj-1322772389.cos.accelerate.myqcloud.com/yydsslgj.json?t={timestamp}"
+        logger.debug(f"请求域名接口: {url}")
         
-    except KeyboardInterrupt:
-        logger.info("\n用户中断执行")
-    except Exception as e:
-        logger.error(f"程序执行异常: {str(e)}", exc_info=True)
-        sys.exit(1)
+        domain_list = []
+        try:
+            response = session.get(
+                url,
+                headers=self.headers,
+                timeout=10,
+                verify=False
+            )
+            logger.info(f"域名接口响应状态: {response.status_code}")
+            if response.status_code == 200:
+                data = response.json()
+                logger.debug(f"域名接口返回数据: {json.dumps(data, ensure_ascii=False)}")
+                key_list = data.get('keyList', '')
+                if key_list:
+                    domain_list = [d.strip() for d in key_list.split(',') if d.strip()]
+                    logger.info(f"成功获取域名列表: {domain_list}")
+            else:
+                logger.warning(f"域名接口请求失败: HTTP {response.status_code}")
+                logger.debug(f"响应内容: {response.text}")
+        except requests.exceptions.Timeout:
+            logger.error("获取域名请求超时")
+        except requests.exceptions.ConnectionError:
+            logger.error("获取域名连接错误")
+        except Exception as e:
+            logger.error(f"获取域名过程异常: {str(e)}", exc_info=True)
+        return domain_list
+
+SITE = SlgjSite(__file__)
+
+def main():
+    """主函数 - 支持多账户处理"""
+    # 先注册站点前缀，SLGJ_DAEMON / SLGJ_PROFILE 等变量才能被读取
+    set_site_prefixes([SITE.env_prefix])
+    run_sites([SITE], daemon=is_daemon_mode(sys.argv[1:]), profile=is_profile_mode(sys.argv[1:]))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()